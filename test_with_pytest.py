@@ -1,6 +1,15 @@
 # -*- coding: utf-8 -*-
 # File: test_with_pytest.py
 
+import json
+import logging
+import logging.config
+import os
+import time
+from pathlib import Path
+
+import pytest
+
 from utils.array import *
 from utils.color import *
 from utils.config import *
@@ -20,3 +29,217 @@ from utils.types_ import *
 
 def test_nothing():
     pass
+
+
+def _close_logger(logger):
+    for handler in list(logger.handlers):
+        handler.close()
+
+
+def _read_log(log_dir):
+    (log_file,) = Path(log_dir).glob("log_*/log.jsonl")
+    with open(log_file, encoding="utf-8") as f:
+        return [json.loads(line)["msg"] for line in f]
+
+
+def _log_from_worker(log_dir, i):
+    get_logger("test_logger_pool", log_dir=log_dir).info(f"worker {i}")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_logger_fork(tmp_path, capfd):
+    logger = get_logger("test_logger_fork", log_dir=tmp_path)
+    pid = os.fork()
+    if pid == 0:
+        logger.info("child")
+        os._exit(0)
+    os.waitpid(pid, 0)
+    _close_logger(logger)
+    assert _read_log(tmp_path) == ["child"]
+    assert "child" in capfd.readouterr().err
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_logger_fork_pool(tmp_path, capfd):
+    import multiprocessing
+
+    get_logger("test_logger_pool", log_dir=tmp_path)
+    with multiprocessing.get_context("fork").Pool(2) as pool:
+        pool.starmap(_log_from_worker, [(tmp_path, i) for i in range(4)])
+    _close_logger(logging.getLogger("test_logger_pool"))
+    assert sorted(_read_log(tmp_path)) == [f"worker {i}" for i in range(4)]
+    err = capfd.readouterr().err
+    assert all(f"worker {i}" in err for i in range(4))
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_logger_fork_reconfigure(tmp_path):
+    logger = get_logger("test_logger_reconfigure", log_dir=tmp_path)
+    (handler,) = logger.handlers
+    assert handler.is_alive()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        alive = handler.is_alive()
+        replaced = get_logger("test_logger_reconfigure", log_dir=tmp_path).handlers[0] is not handler
+        os.write(write_fd, bytes([not alive and replaced]))
+        os._exit(0)
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 1) == b"\x01"
+    os.close(read_fd)
+    os.close(write_fd)
+    assert handler.is_alive()
+    _close_logger(logger)
+    assert not handler.is_alive()
+
+
+def test_logger_mutated_args(capfd):
+    logger = get_logger("test_logger_args")
+    state = {}
+    for i in range(1, 4):
+        state["step"] = i
+        logger.info("state=%s", state)
+        state["step"] = -1
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logger.exception("failed")
+    _close_logger(logger)
+    err = capfd.readouterr().err
+    assert all(f"state={{'step': {i}}}" in err for i in range(1, 4))
+    assert "{'step': -1}" not in err
+    assert "RuntimeError: boom" in err
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_logger_fork_buffer(tmp_path):
+    logger = get_logger("test_logger_buffer", log_dir=tmp_path)
+    logger.info("parent")
+    time.sleep(0.1)  # Let the listener thread buffer the record
+    pid = os.fork()
+    if pid == 0:
+        logging.shutdown()
+        os._exit(0)
+    os.waitpid(pid, 0)
+    _close_logger(logger)
+    assert _read_log(tmp_path) == ["parent"]
+
+
+def test_logger_timed_flush(tmp_path):
+    logger = get_logger("test_logger_timed_flush", log_dir=tmp_path)
+    logger.info("flushed")
+    time.sleep(1.5)  # Records are flushed at most 1 second after being emitted
+    assert _read_log(tmp_path) == ["flushed"]
+    _close_logger(logger)
+
+
+def test_logger_compress_stream(tmp_path):
+    import gzip
+
+    max_bytes = 512
+    logger = get_logger("test_logger_compress_stream", log_dir=tmp_path, max_bytes=max_bytes, compress_stream=True)
+    msgs = [f"record {i} {os.urandom(16).hex()}" for i in range(200)]
+    for msg in msgs:
+        logger.info(msg)
+    _close_logger(logger)
+    log_files = list(tmp_path.glob("log_*/log.jsonl*.gz"))
+    assert len(log_files) > 1
+    logged = []
+    for log_file in log_files:
+        assert log_file.stat().st_size <= max_bytes
+        with gzip.open(log_file, "rt", encoding="utf-8") as f:
+            logged.extend(json.loads(line)["msg"] for line in f)
+    assert sorted(logged) == sorted(msgs)
+
+
+def test_logger_compress_backups(tmp_path):
+    import gzip
+
+    from utils import logger as logger_module
+
+    logger = get_logger("test_logger_compress", log_dir=tmp_path, max_bytes=1024, compress=True)
+    msgs = [f"record {i}" for i in range(100)]
+    for msg in msgs:
+        logger.info(msg)
+    _close_logger(logger)
+    logger_module._COMPRESS_EXECUTOR.submit(lambda: None).result()  # Wait for queued backups
+    log_dir = next(tmp_path.glob("log_*"))
+    backups = [path for path in log_dir.iterdir() if path.name != "log.jsonl"]
+    assert backups and all(path.suffix in (".gz", ".zst") for path in backups)
+    logged = _read_log(tmp_path)
+    for backup in backups:
+        if backup.suffix == ".gz":
+            with gzip.open(backup, "rt", encoding="utf-8") as f:
+                logged.extend(json.loads(line)["msg"] for line in f)
+    if all(path.suffix == ".gz" for path in backups):
+        assert sorted(logged) == sorted(msgs)
+
+
+def test_logger_external_dict_config(tmp_path):
+    logger = get_logger("test_logger_external", log_dir=tmp_path)
+    (handler,) = logger.handlers
+    logging.config.dictConfig({"version": 1, "disable_existing_loggers": False})  # Closes every handler
+    assert not handler.is_alive()
+    logger = get_logger("test_logger_external", log_dir=tmp_path)
+    (new_handler,) = logger.handlers
+    assert new_handler is not handler and new_handler.is_alive()
+    assert get_logger("test_logger_external", log_dir=tmp_path).handlers == [new_handler]
+    logger.info("after dictConfig")
+    _close_logger(logger)
+    assert _read_log(tmp_path) == ["after dictConfig"]
+
+
+def test_hash():
+    import hashlib
+
+    assert hash_("abc") == hashlib.sha3_256(b"abc").hexdigest()
+    assert hash_("abc", algo="md5", max_len=8) == hashlib.md5(b"abc").hexdigest()[:8]
+    assert hash_(b"abc", cache=True) == hash_(b"abc")
+    hash_.cache_clear()
+    assert hash_many(["a", b"b"], ver=2, digest_size=512) == [
+        hashlib.sha512(b"a").hexdigest(),
+        hashlib.sha512(b"b").hexdigest(),
+    ]
+    with pytest.raises(ValueError):
+        hash_many(["a"], algo="crc")
+
+
+def test_hash_file(tmp_path):
+    import hashlib
+
+    data = os.urandom(3 * 1024**2 + 1)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    assert hash_file(path) == hashlib.sha3_256(data).hexdigest()
+    assert hash_file(str(path), algo="sha", ver=1) == hashlib.sha1(data).hexdigest()
+    assert hash_file(path, algo="md5", max_len=10) == hashlib.md5(data).hexdigest()[:10]
+
+
+def test_gen_keys():
+    import base64
+
+    keys = gen_keys(5, size=16)
+    assert len(set(keys)) == 5
+    assert all(len(base64.urlsafe_b64decode(key)) == 16 for key in keys)
+    assert len(base64.urlsafe_b64decode(gen_key(16))) == 16
+    assert gen_keys(0) == []
+
+
+def test_parity():
+    from decimal import Decimal
+
+    assert is_odd(3) and is_even(-4) and is_even(0)
+    assert is_odd(3.0) and not is_even(2.5) and is_even(Decimal(4))
+
+
+def test_rescaler():
+    rescaler = make_rescaler(0, 10, 100, 200)
+    assert [rescaler(x) for x in (0, 5, 10)] == [rescale(x, 0, 10, 100, 200) for x in (0, 5, 10)] == [100, 150, 200]
+
+
+def test_array_ops():
+    np = pytest.importorskip("numpy")
+
+    arr = np.array([0, 2.5, 10])
+    assert np.allclose(rescale_array(arr, 0, 10, -1, 1), [rescale(x, 0, 10, -1, 1) for x in arr])
+    assert np.array_equal(clamp_array([-5, 5, 15], 0, 10), [clamp(x, 0, 10) for x in (-5, 5, 15)])
@@ -25,9 +25,9 @@ def get_all_combs(arr: Array[Any]) -> Iterator[Tuple[Any, ...]]:
         Iterator[Tuple[Any, ...]]: All combinations from `arr`.
     """
 
-    from itertools import combinations
+    from itertools import chain, combinations
 
-    return (c for comb in map(lambda x: tuple(combinations(arr, x)), range(1, len(arr) + 1)) for c in comb)
+    return chain.from_iterable(combinations(arr, r) for r in range(1, len(arr) + 1))
 
 
 def split_arr(
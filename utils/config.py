@@ -1,8 +1,17 @@
 # -*- coding: utf-8 -*-
 # File: utils/config.py
 
+import json
+import os
+from configparser import ConfigParser
+from copy import deepcopy
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Dict, Iterator, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .file_ops import get_file_ext, read_file
 from .types_ import PathLike
@@ -16,6 +25,50 @@ __all__ = [
 ]
 
 
+_yaml = None  # PyYAML, imported on first use as it is slow to import
+_yaml_cache: Dict[Tuple[str, bool], Tuple[int, int, Any]] = {}  # (Path, safe) -> (mtime in ns, size, object)
+
+
+def _get_yaml() -> Any:
+    """
+    Import PyYAML once and return the module.
+
+    Raises:
+        ImportError: PyYAML is not installed.
+
+    Returns:
+        Any: The yaml module.
+    """
+
+    global _yaml
+    if _yaml is None:
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("Could not import yaml. Try `pip install -U pyyaml`.")
+        _yaml = yaml
+    return _yaml
+
+
+def _loads(data: str) -> Any:
+    """
+    Deserialize a JSON string, using orjson if it is installed.
+
+    Args:
+        data (str): Target JSON string.
+
+    Returns:
+        Any: Deserialized Python object.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:  # E.g., NaN or integers beyond 64 bits, which json accepts
+            pass
+    return json.loads(data)
+
+
 def load_json(json_path: PathLike) -> Any:
     """
     Load a .json file.
@@ -29,10 +82,8 @@ def load_json(json_path: PathLike) -> Any:
 
     assert get_file_ext(json_path := Path(json_path)).lower() == ".json", ".json required."
 
-    import json
-
     with json_path.open() as f_json:
-        return json.load(f_json)
+        return _loads(f_json.read())
 
 
 def load_jsonl(jsonl_path: PathLike) -> Iterator[Any]:
@@ -48,32 +99,43 @@ def load_jsonl(jsonl_path: PathLike) -> Iterator[Any]:
 
     assert get_file_ext(jsonl_path := Path(jsonl_path)).lower() == ".jsonl", ".jsonl required."
 
-    import json
-
     for line in read_file(jsonl_path):
-        yield json.loads(line)
+        yield _loads(line)
 
 
 def load_yaml(yaml_path: PathLike, safe: bool = True) -> Any:
     """
-    Load a .yaml file.
+    Load a .yaml (or .yml) file. Loaded files are cached until their
+    modification time or size changes.
 
     Args:
-        yaml_path (PathLike): Path to the .yaml file.
+        yaml_path (PathLike): Path to the .yaml (or .yml) file.
         safe (bool, optional): Load `yaml_path` safely. Defaults to True.
 
     Returns:
         Any: Python object loaded from `yaml_path`.
     """
 
-    assert get_file_ext(yaml_path := Path(yaml_path)).lower() == ".yaml", ".yaml required."
+    assert get_file_ext(yaml_path := Path(yaml_path)).lower() in {".yaml", ".yml"}, ".yaml or .yml required."
 
-    try:
-        import yaml
-    except ImportError:
-        raise ImportError("Could not import yaml. Try `pip install -U pyyaml`.")
+    # Parsing YAML is far slower than copying the result, so reuse it until the file changes
+    stat = os.stat(yaml_path)
+    if (cached := _yaml_cache.get(key := (os.path.abspath(yaml_path), safe))) is not None:
+        mtime_ns, size, obj = cached
+        if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+            return deepcopy(obj)  # Callers may modify the returned object
+
+    yaml = _get_yaml()
     with yaml_path.open() as f_yaml:
-        return yaml.safe_load(f_yaml) if safe else yaml.load(f_yaml)
+        # Prefer the LibYAML-based loaders, which are much faster than the pure Python ones
+        if safe:
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        else:
+            loader = getattr(yaml, "CFullLoader", yaml.FullLoader)
+        obj = yaml.load(f_yaml, Loader=loader)
+    _yaml_cache[key] = (stat.st_mtime_ns, stat.st_size, obj)
+
+    return deepcopy(obj)
 
 
 def load_ini(ini_path: PathLike) -> Any:
@@ -89,8 +151,6 @@ def load_ini(ini_path: PathLike) -> Any:
 
     assert get_file_ext(ini_path := Path(ini_path)).lower() == ".ini", ".ini required."
 
-    from configparser import ConfigParser
-
     def _load_ini(ini_path: PathLike) -> ConfigParser:
         config = ConfigParser()
         config.read(ini_path)
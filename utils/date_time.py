@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 # File: utils/date_time.py
 
+from datetime import datetime
+
 __all__ = [
     "get_date",
     "get_time",
@@ -23,8 +25,6 @@ def get_date(date_format: str = r"%Y-%m-%d") -> str:
 
     assert date_format != "", f'"{date_format}" is empty. `date_format` must not be empty.'
 
-    from datetime import datetime
-
     return datetime.now().strftime(date_format)
 
 
@@ -42,8 +42,6 @@ def get_time(time_format: str = r"%H:%M:%S") -> str:
 
     assert time_format != "", f'"{time_format}" is empty. `time_format` must not be empty.'
 
-    from datetime import datetime
-
     return datetime.now().strftime(time_format)
 
 
@@ -68,7 +66,14 @@ def get_datetime(
         str: Today's date and current time.
     """
 
-    return sep.join((get_date(date_format), get_time(time_format))[:: (-1) ** (not date_first)])
+    assert date_format != "", f'"{date_format}" is empty. `date_format` must not be empty.'
+    assert time_format != "", f'"{time_format}" is empty. `time_format` must not be empty.'
+
+    # Read the clock once, so that date and time cannot straddle midnight
+    now = datetime.now()
+    date_str, time_str = now.strftime(date_format), now.strftime(time_format)
+
+    return f"{date_str}{sep}{time_str}" if date_first else f"{time_str}{sep}{date_str}"
 
 
 def get_etr(
@@ -16,7 +16,7 @@ def timer_(
     callback: Optional[Callable[[str, Tuple[Any], StrDict[Any], float], None]] = None,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
-    A decorator for measuring a function's execution time using time.perf_counter().
+    A decorator for measuring a function's execution time using time.perf_counter_ns().
 
     Args:
         callback (Optional[Callable[[str, Tuple[Any], StrDict[Any], float], None]], optional): A function that takes
@@ -38,10 +38,10 @@ def timer_(
             callback = lambda f, a, k, t: print(f"{f}({args2str(a)}, {kwargs2str(k)}): {round(t, 3)} s")
 
         def inner(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.perf_counter()
+            start_ns = time.perf_counter_ns()
             result = func(*args, **kwargs)
-            end_time = time.perf_counter()
-            callback(func.__name__, args, kwargs, end_time - start_time)
+            end_ns = time.perf_counter_ns()
+            callback(func.__name__, args, kwargs, (end_ns - start_ns) / 1e9)
             return result
 
         return inner
@@ -25,6 +25,8 @@ from .types_ import Array, PathLike, StrDict
 
 __all__ = ["download_files"]
 
+_CHUNK_SIZE = 1024**2  # Max. size of each chunk written to file (and reported to the progress bar)
+
 
 async def _download_file(
     url: PathLike,
@@ -55,7 +57,7 @@ async def _download_file(
                 desc=trunc_str(file_path, 50, mode=4, replacement="..."),
             )
             with open(file_path, mode="wb") as f, ind_bar:
-                async for chunk in response.content.iter_chunked(512):
+                async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
                     f.write(chunk)
                     ind_bar.update(len(chunk))
 
@@ -136,7 +138,7 @@ def download_files(
 
     _urls = []
     for url in urls:
-        if any(map(lambda x: isinstance(url, x), (str, Path))):
+        if isinstance(url, (str, Path)):
             url = (url,)
         url, filename = _process_url(*url)
         file_path = os.path.join(download_dir, filename)
@@ -297,7 +297,7 @@ def iter_files(
         Iterator[Path]: File paths under `tgt_dir`.
     """
 
-    exts = set(map(lambda x: x.lower(), exts)) if exts is not None and case_insensitive else exts
+    exts = {ext.lower() for ext in exts} if exts is not None and case_insensitive else exts
     for child in (tgt_dir := Path(tgt_dir)).iterdir():
         if is_file(child):
             if exts is not None:
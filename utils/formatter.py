@@ -19,6 +19,9 @@ __all__ = [
     "trunc_str",
 ]
 
+_NUM_UNITS = ("", "K", "M", "B", "T", "Q", "Qu", "S", "Sp", "O", "N")
+_SIZE_UNITS = ("", "K", "M", "G", "T", "P", "E", "Z", "Y", "R", "Q")
+
 
 def arr2str(
     arr: Array[Any],
@@ -191,13 +194,12 @@ def convert_num(
     assert threshold > 0, f"{threshold} > 0. `threshold` must be a positive number."
     assert div > 0, f"{div} > 0. `div` must be a positive number."
 
-    UNITS = ["", "K", "M", "B", "T", "Q", "Qu", "S", "Sp", "O", "N"]
-    max_idx = len(UNITS) - 1
+    max_idx = len(_NUM_UNITS) - 1
     i = 0
     while abs(num) >= threshold and i < max_idx:
         num /= div
         i += 1
-    return num, UNITS[i]
+    return num, _NUM_UNITS[i]
 
 
 def convert_size(
@@ -226,13 +228,12 @@ def convert_size(
     assert threshold > 0, f"{threshold} > 0. `threshold` must be a positive number."
     assert div > 0, f"{div} > 0. `div` must be a positive number."
 
-    UNITS = ["", "K", "M", "G", "T", "P", "E", "Z", "Y", "R", "Q"]
-    max_idx = len(UNITS) - 1
+    max_idx = len(_SIZE_UNITS) - 1
     i = 0
     while size >= threshold and i < max_idx:
         size /= div
         i += 1
-    return size, f"{UNITS[i]}B"
+    return size, f"{_SIZE_UNITS[i]}B"
 
 
 def trunc_str(
@@ -264,8 +265,6 @@ def trunc_str(
         mode_set := {1, 2, 3, 4}
     ), f"{mode} does not belong to {mode_set}. `mode` must be any one in {mode_set}."
 
-    from .num_ops import is_odd
-
     # Return `text` itself if no truncation is needed
     if len(text := str(text)) <= n:
         return text
@@ -274,7 +273,7 @@ def trunc_str(
     if mode == 1:
         truncated = "".join((text[:n], replacement))
     elif mode == 2:
-        truncated = "".join((text[: (left := n // 2)], replacement, text[-(left + is_odd(n)) :]))
+        truncated = "".join((text[: (left := n // 2)], replacement, text[-(left + (n & 1)) :]))
     elif mode == 3:
         truncated = "".join((replacement, text[(mid := (len(text) - n) // 2) : mid + n], replacement))
     else:
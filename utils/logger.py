@@ -1,19 +1,38 @@
 # -*- coding: utf-8 -*-
 # File: utils/logger.py
 
+import copy
 import gzip
 import json
 import logging
 import logging.config
-from logging.handlers import RotatingFileHandler
+import os
+import shutil
+import sys
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from json.encoder import encode_basestring_ascii
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Any, Literal, Optional
+from queue import SimpleQueue
+from typing import IO, Any, List, Literal, Optional, Tuple
 
 from .color import colored
-from .date_time import get_date, get_datetime, get_time
+from .date_time import get_datetime
 from .file_ops import create_dir, remove_file
 from .types_ import PathLike, StrDict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 __all__ = ["get_logger"]
 
 _LOG_LEVEL_DICT = {
@@ -24,22 +43,145 @@ _LOG_LEVEL_DICT = {
     logging.CRITICAL: ("CRT", "red"),
 }
 _UNKNOWN_LOG = ("UNK", "white")
+_LOG_LEVEL_TABLE = tuple(_LOG_LEVEL_DICT.get(levelno, _UNKNOWN_LOG) for levelno in range(logging.CRITICAL + 1))
+_FILE_BUFFER_SIZE = 64 * 1024
+_COPY_BUFFER_SIZE = 1024**2
+_STREAM_COMPRESS_LEVEL = 6
+_COMPRESS_EXECUTOR = ThreadPoolExecutor(max_workers=1)  # Joined at interpreter exit, so pending backups complete
+_forked = False  # True in processes forked from the one that imported this module
+_queue_handlers = weakref.WeakSet()  # Live _QueueHandler instances, switched to synchronous handling after fork()
+_file_handlers = weakref.WeakSet()  # Live _InfiniteFileHandler instances, flushed before fork()
+_applied_logger_key: Optional[Tuple[Any, ...]] = None  # Arguments of the logger last passed to dictConfig()
+_PROCESS_DATETIME = get_datetime()  # Shared by all log directories created in this process
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string, using orjson if it is installed.
+    Falls back to json for objects orjson rejects (e.g., integers beyond 64
+    bits).
+
+    Args:
+        obj (Any): Target object.
+
+    Returns:
+        str: JSON string.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj)
+
+
+def _to_json(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string, escaping strings directly.
+
+    Args:
+        obj (Any): Target object.
+
+    Returns:
+        str: JSON string.
+    """
+
+    return encode_basestring_ascii(obj) if isinstance(obj, str) else _dumps(obj)
+
+
+def _compress_file(path: str) -> None:
+    """
+    Compress a file with zstandard (.zst) if it is installed, or gzip (.gz)
+    otherwise, and then remove the original file.
+
+    Args:
+        path (str): Target file.
+    """
+
+    if zstandard is not None:
+        with open(path, "rb") as f_in, open(f"{path}.zst", "wb") as f_out:
+            zstandard.ZstdCompressor(level=3).copy_stream(f_in, f_out)
+    else:
+        with open(path, "rb") as f_in, gzip.open(f"{path}.gz", "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out, _COPY_BUFFER_SIZE)
+    remove_file(path)
+
+
+def _get_console_styles(use_color: bool) -> Tuple[Tuple[logging.PercentStyle, ...], logging.PercentStyle]:
+    """
+    Build the console log style of every level.
+
+    Args:
+        use_color (bool): Color the log with ANSI escape sequences.
+
+    Returns:
+        Tuple[Tuple[logging.PercentStyle, ...], logging.PercentStyle]: Styles
+            indexed by level number (up to logging.CRITICAL), and style for
+            unknown levels.
+    """
+
+    paint = colored if use_color else lambda text, color: text
+    info = "[%(asctime)s @%(name)s/%(filename)s:%(lineno)d]"
+    msg = paint("%(message)s", "white")
+    styles = {
+        (abbrev, color): logging.PercentStyle(f"{paint(f'{info} [{abbrev}]', color)} {msg}")
+        for abbrev, color in {*_LOG_LEVEL_TABLE, _UNKNOWN_LOG}
+    }
+    return tuple(styles[level_info] for level_info in _LOG_LEVEL_TABLE), styles[_UNKNOWN_LOG]
+
+
+_CONSOLE_STYLES = {use_color: _get_console_styles(use_color) for use_color in (False, True)}
 
 
 class _ConsoleFormatter(logging.Formatter):
     """
-    A custom formatter for logging to console.
+    A custom formatter for logging to console. Colors are used only if stderr
+    is a terminal and the NO_COLOR environment variable is not set.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        use_color = sys.stderr is not None and sys.stderr.isatty() and not os.environ.get("NO_COLOR")
+        self._styles, self._unknown_style = _CONSOLE_STYLES[bool(use_color)]
+        self._time_cache = (-1, "")  # (Second, formatted time) of the last formatted record
+
+    # Override
+    def usesTime(self) -> bool:
+        return True
+
+    # Override
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        sec = int(record.created)
+        cached_sec, time_str = self._time_cache
+        if sec != cached_sec:
+            time_str = time.strftime(datefmt or self.default_time_format, self.converter(sec))
+            self._time_cache = (sec, time_str)
+        if datefmt is None and self.default_msec_format:
+            return self.default_msec_format % (time_str, record.msecs)
+        return time_str
+
     # Override
     def format(self, record: logging.LogRecord) -> str:
-        info = "[%(asctime)s @%(name)s/%(filename)s:%(lineno)d]"
-        msg = colored("%(message)s", "white")
-        abbrev, color = _LOG_LEVEL_DICT.get(record.levelno, _UNKNOWN_LOG)
-        fmt = f"{colored(f'{info} [{abbrev}]', color)} {msg}"
-        self._style._fmt = fmt
-        self._fmt = fmt
-        return super().format(record)
+        # Use the message rendered by _QueueHandler.prepare(), as the arguments may have changed since
+        if "message" not in record.__dict__:
+            record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        s = self.formatMessage(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        for extra in (record.exc_text, record.stack_info and self.formatStack(record.stack_info)):
+            if extra:
+                if s[-1:] != "\n":
+                    s += "\n"
+                s += extra
+        return s
+
+    # Override
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        levelno = record.levelno
+        style = self._styles[levelno] if 0 <= levelno <= logging.CRITICAL else self._unknown_style
+        return style.format(record)
 
 
 class _FileFormatter(logging.Formatter):
@@ -47,24 +189,38 @@ class _FileFormatter(logging.Formatter):
     A custom formatter for logging to file (JSON Lines).
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._date_time_cache = (-1, "", "")  # (Second, date, time) of the last formatted record
+
     # Override
     def format(self, record: logging.LogRecord) -> str:
-        log_dict = {
-            "name": record.name,
-            "level": _LOG_LEVEL_DICT.get(record.levelno, _UNKNOWN_LOG[:1])[0],
-            "file": record.filename,
-            "func": record.funcName,
-            "line": record.lineno,
-            "date": get_date(),
-            "time": get_time(),
-            "msg": record.msg,
-        }
-        return json.dumps(log_dict)
+        levelno = record.levelno
+        sec = int(record.created)
+        cached_sec, date_str, time_str = self._date_time_cache
+        if sec != cached_sec:
+            local_time = time.localtime(sec)
+            date_str, time_str = time.strftime(r"%Y-%m-%d", local_time), time.strftime(r"%H:%M:%S", local_time)
+            self._date_time_cache = (sec, date_str, time_str)
+        abbrev = (_LOG_LEVEL_TABLE[levelno] if 0 <= levelno <= logging.CRITICAL else _UNKNOWN_LOG)[0]
+
+        # Fixed schema, so build the JSON object directly instead of through a dictionary
+        return (
+            f'{{"name":{_to_json(record.name)},"level":"{abbrev}","file":{_to_json(record.filename)},'
+            f'"func":{_to_json(record.funcName)},"line":{record.lineno},"date":"{date_str}","time":"{time_str}",'
+            f'"msg":{_to_json(record.msg)}}}'
+        )
 
 
 class _InfiniteFileHandler(RotatingFileHandler):
     """
-    A custom file handler for making infinitely many log backups.
+    A custom file handler for making infinitely many log backups. Writes are
+    buffered and flushed at most `flush_interval` seconds after a record is
+    emitted, instead of after every record.
+
+    If `compress_stream` is True, each flushed batch of records is written as
+    a gzip member, so the log file is a valid (concatenated) gzip file that
+    can be read with gzip.open().
     """
 
     def __init__(
@@ -72,28 +228,280 @@ class _InfiniteFileHandler(RotatingFileHandler):
         filename: PathLike,
         maxBytes: int = 0,
         compress: bool = False,
+        compress_stream: bool = False,
+        flush_interval: float = 1.0,
     ) -> None:
-        super().__init__(filename, maxBytes=maxBytes)
-        self._compress = compress
+        self._compress_stream = compress_stream
+        self._pending = bytearray()  # Records not yet compressed. Used only if `compress_stream` is True.
+        self._bytes_written = 0  # Size of the current log file, tracked without querying the stream
+        super().__init__(filename, maxBytes=maxBytes, encoding="utf-8")
+        self._compress = compress and not compress_stream  # Backups of a gzip stream are already compressed
         self._backup_count = 0
+        self._flush_interval = flush_interval
+        self._flush_timer: Optional[threading.Timer] = None
+        _file_handlers.add(self)
+
+    # Override
+    def _open(self) -> IO[Any]:
+        if self._compress_stream:
+            stream = open(self.baseFilename, "ab")
+        else:
+            stream = open(self.baseFilename, self.mode, buffering=_FILE_BUFFER_SIZE, encoding=self.encoding)
+        self._bytes_written = stream.tell()  # Appending, so this is the existing file size
+        return stream
+
+    # Override
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        return self._should_rollover(self._get_size(f"{self.format(record)}{self.terminator}"))
+
+    def _get_size(self, msg: str) -> int:
+        # orjson writes non-ASCII characters as is, so only ASCII lines have as many bytes as characters
+        return len(msg) if msg.isascii() else len(msg.encode(self.encoding))
+
+    def _should_rollover(self, msg_len: int) -> bool:
+        if self.maxBytes <= 0:
+            return False
+        if self._pending and self._bytes_written + len(self._pending) + msg_len >= self.maxBytes:
+            self.flush()  # Compress pending records to learn how much of the limit they actually take
+        return self._bytes_written > 0 and self._bytes_written + msg_len >= self.maxBytes
+
+    # Override
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = f"{self.format(record)}{self.terminator}"
+            if self._should_rollover(msg_size := self._get_size(msg)):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            if self._compress_stream:
+                self._pending += msg.encode(self.encoding)
+                if len(self._pending) >= _FILE_BUFFER_SIZE:
+                    self.flush()
+            else:
+                self.stream.write(msg)
+                self._bytes_written += msg_size
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._flush_interval, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    # Override
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self._pending and self.stream:
+                self._bytes_written += self.stream.write(
+                    gzip.compress(self._pending, compresslevel=_STREAM_COMPRESS_LEVEL)
+                )
+                self._pending.clear()
+            super().flush()
+        finally:
+            self.release()
+
+    def _timed_flush(self) -> None:
+        self.acquire()
+        try:
+            self._flush_timer = None
+            self.flush()
+        finally:
+            self.release()
+
+    # Override
+    def close(self) -> None:
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        finally:
+            self.release()
+        super().close()
 
     # Override
     def doRollover(self) -> None:
         if self.stream:
+            self.flush()
             self.stream.close()
             self.stream = None
         self._backup_count += 1
         date_time = get_datetime()
-        backup_name = f"{self.baseFilename}.{date_time}.{self._backup_count}"
+        if self._compress_stream:  # Keep ".gz" as the last extension
+            root, ext = os.path.splitext(self.baseFilename)
+            backup_name = f"{root}.{date_time}.{self._backup_count}{ext}"
+        else:
+            backup_name = f"{self.baseFilename}.{date_time}.{self._backup_count}"
         self.rotate(self.baseFilename, backup_name)
         if self._compress:
-            with open(backup_name, "rb") as f_in, gzip.open(f"{backup_name}.gz", "wb") as f_out:
-                f_out.writelines(f_in)
-            remove_file(backup_name)
+            try:
+                _COMPRESS_EXECUTOR.submit(_compress_file, backup_name)
+            except RuntimeError:  # Executor has been shut down at interpreter exit
+                _compress_file(backup_name)
         if not self.delay:
             self.stream = self._open()
 
 
+class _QueueHandler(QueueHandler):
+    """
+    A custom queue handler that owns the listener draining its queue, so that
+    formatting and I/O of the wrapped handlers run in a background thread.
+
+    Threads do not survive fork(), so in forked processes records are instead
+    passed to the wrapped handlers synchronously and flushed immediately, as
+    such processes (e.g., multiprocessing workers) may exit without running
+    atexit handlers.
+    """
+
+    def __init__(self, *handlers: logging.Handler) -> None:
+        super().__init__(SimpleQueue())
+        self._handlers = handlers
+        self._closed = False
+        self._pid = os.getpid()
+        self._listener: Optional[QueueListener] = None  # None if records are handled synchronously
+        if not _forked:
+            self._listener = QueueListener(self.queue, *handlers, respect_handler_level=True)
+            self._listener.start()
+        _queue_handlers.add(self)
+
+    def is_alive(self) -> bool:
+        # Handlers inherited through fork() are replaced, so that get_logger() returns a fresh pipeline
+        if self._closed or self._pid != os.getpid():
+            return False
+        if self._listener is None:  # Created in a forked process, where records are handled synchronously
+            return True
+        thread = self._listener._thread
+        return thread is not None and thread.is_alive()
+
+    def _detach_listener(self) -> None:
+        # Called in a forked child, where the listener thread no longer exists. Records left in the
+        # inherited queue are dropped, as the parent process still handles them.
+        self.queue = SimpleQueue()
+        self._listener = None
+
+    # Override
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue never leaves this process, so the record need not be pickleable. Only render the message
+        # here, as the arguments may be mutated before the listener thread formats the record. The rest of the
+        # formatting (including exception rendering) still happens there, and `msg` is left as is for
+        # _FileFormatter. The record is copied since other handlers of the logger may format it as well.
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        return record
+
+    # Override
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._listener is not None:
+            super().emit(record)
+            return
+        for handler in self._handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+                handler.flush()
+
+    # Override
+    def close(self) -> None:
+        self.acquire()
+        try:
+            if self._listener is not None:
+                self._listener.stop()  # Drain the queue before the wrapped handlers are closed
+                self._listener = None
+            self._closed = True
+        finally:
+            self.release()
+        for handler in self._handlers:
+            handler.close()
+        super().close()
+
+
+_fork_locked_handlers: List[_InfiniteFileHandler] = []  # Handlers locked by _before_fork()
+
+
+def _before_fork() -> None:
+    # Flush buffered records, or the child would inherit and write them again. The locks are held until
+    # fork() returns, so that the listener thread cannot buffer more records in between.
+    _fork_locked_handlers[:] = _file_handlers
+    for handler in _fork_locked_handlers:
+        handler.acquire()
+        handler.flush()
+
+
+def _after_fork_in_parent() -> None:
+    for handler in _fork_locked_handlers:
+        handler.release()
+    _fork_locked_handlers.clear()
+
+
+def _after_fork_in_child() -> None:
+    # Handler locks have already been reinitialized by the logging module, so they are not released here
+    global _COMPRESS_EXECUTOR, _forked
+    _forked = True
+    _fork_locked_handlers.clear()
+    _COMPRESS_EXECUTOR = ThreadPoolExecutor(max_workers=1)  # The worker thread did not survive fork()
+    for handler in _file_handlers:
+        handler._flush_timer = None
+    for handler in list(_queue_handlers):
+        handler._detach_listener()
+
+
+if hasattr(os, "register_at_fork"):  # Not available on Windows, which cannot fork()
+    os.register_at_fork(
+        before=_before_fork,
+        after_in_parent=_after_fork_in_parent,
+        after_in_child=_after_fork_in_child,
+    )
+
+
+def _get_queue_handler(
+    console_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO",
+    datefmt: Optional[str] = None,
+    filename: Optional[PathLike] = None,
+    maxBytes: int = 0,
+    compress: bool = False,
+    compress_stream: bool = False,
+) -> _QueueHandler:
+    """
+    Create a handler that writes logs to console and, optionally, to file
+    (JSON Lines) in a background thread.
+
+    Args:
+        console_level (str, optional): Level of logging to console. Must be
+            any one in {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}.
+            Defaults to "INFO".
+        datefmt (Optional[str], optional): Date and time format of console
+            logs. Defaults to None.
+        filename (Optional[PathLike], optional): If not None, path to the log
+            file. Defaults to None.
+        maxBytes (int, optional): Max. size of the log file before rollover.
+            Defaults to 0.
+        compress (bool, optional): Compress backup log files with zstandard
+            if it is installed, or gzip otherwise. Defaults to False.
+        compress_stream (bool, optional): Write the log file as concatenated
+            gzip members. Defaults to False.
+
+    Returns:
+        _QueueHandler: Queue handler feeding a logging.StreamHandler and an
+            _InfiniteFileHandler (if `filename` is not None).
+    """
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(console_level)
+    console_handler.setFormatter(_ConsoleFormatter(datefmt=datefmt))
+    if filename is None:
+        return _QueueHandler(console_handler)
+
+    file_handler = _InfiniteFileHandler(
+        filename,
+        maxBytes=maxBytes,
+        compress=compress,
+        compress_stream=compress_stream,
+    )
+    file_handler.setFormatter(_FileFormatter())
+    return _QueueHandler(console_handler, file_handler)
+
+
 def _get_logger_config(
     name: str = __name__,
     level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO",
@@ -101,6 +509,7 @@ def _get_logger_config(
     log_dir: Optional[PathLike] = None,
     max_bytes: int = 0,
     compress: bool = False,
+    compress_stream: bool = False,
 ) -> StrDict[Any]:
     """
     Construct a configuration dictionary for logging.config.dictConfig().
@@ -113,39 +522,42 @@ def _get_logger_config(
         datetime_format (Optional[str], optional): Date and time format.
             Defaults to r"%Y-%m-%d %H:%M:%S".
         log_dir (Optional[PathLike], optional): If not None, logs will be
-            written to "`log_dir`/log_<current_date_time>". Defaults to None.
+            written to "`log_dir`/log_<date_time>", where <date_time> is the
+            time at which this module was imported. Defaults to None.
         max_bytes (int, optional): If `max_bytes` > 0, each log file will
             store at most `max_bytes` bytes (i.e., rollover). Used only if
             `log_dir` is not None. Defaults to 0.
-        compress (bool, optional): Compress backup (i.e., rotated) log files.
+        compress (bool, optional): Compress backup (i.e., rotated) log files
+            with zstandard (.zst) if it is installed, or gzip (.gz) otherwise.
+            Used only if `log_dir` is not None. Defaults to False.
+        compress_stream (bool, optional): Compress the current log file as
+            well, by writing it as concatenated gzip members to "log.jsonl.gz"
+            (readable with gzip.open()). `max_bytes` then limits the
+            compressed size, and backup log files are not compressed again.
             Used only if `log_dir` is not None. Defaults to False.
 
+    Raises:
+        ValueError: Invalid `max_bytes`. Must be a non-negative integer.
+
     Returns:
         StrDict[Any]: Configuration dictionary.
     """
 
-    # Basic configuration dictionary
+    # Basic configuration dictionary. Console and file handlers are both fed
+    # by a single queue handler, so the calling thread only enqueues records.
     logger_config = {
         "version": 1,
-        "formatters": {
-            "console_formatter": {
-                "()": _ConsoleFormatter,
-                "datefmt": datetime_format,
-            },
-            "file_formatter": {
-                "()": _FileFormatter,
-            },
-        },
         "handlers": {
-            "console_handler": {
-                "class": "logging.StreamHandler",
-                "formatter": "console_formatter",
-                "level": level,
+            "queue_handler": {
+                "()": _get_queue_handler,
+                "level": logging.DEBUG,
+                "console_level": level,
+                "datefmt": datetime_format,
             }
         },
         "loggers": {
             name: {
-                "handlers": ["console_handler"],
+                "handlers": ["queue_handler"],
                 "level": logging.DEBUG,
                 "propagate": False,
             },
@@ -154,17 +566,17 @@ def _get_logger_config(
 
     # Modify configuration to save logs to files
     if log_dir is not None:
-        assert max_bytes >= 0, f"{max_bytes} >= 0. `max_bytes` must be a non-negative integer."
-        create_dir(log_dir := Path(log_dir) / f"log_{get_datetime()}", exist_ok=True)
-        logger_config["handlers"]["file_handler"] = {
-            "()": _InfiniteFileHandler,
-            "formatter": "file_formatter",
-            "level": logging.DEBUG,
-            "filename": log_dir / "log.jsonl",
-            "maxBytes": max_bytes,
-            "compress": compress,
-        }
-        logger_config["loggers"][name]["handlers"].append("file_handler")
+        if max_bytes < 0:
+            raise ValueError(f"{max_bytes} < 0. `max_bytes` must be a non-negative integer.")
+        create_dir(log_dir := Path(log_dir) / f"log_{_PROCESS_DATETIME}", exist_ok=True)
+        logger_config["handlers"]["queue_handler"].update(
+            {
+                "filename": log_dir / ("log.jsonl.gz" if compress_stream else "log.jsonl"),
+                "maxBytes": max_bytes,
+                "compress": compress,
+                "compress_stream": compress_stream,
+            }
+        )
 
     return logger_config
 
@@ -175,6 +587,7 @@ def get_logger(
     log_dir: Optional[PathLike] = None,
     max_bytes: int = 10 * (1024**2),
     compress: bool = False,
+    compress_stream: bool = False,
 ) -> logging.Logger:
     """
     Get custom logger.
@@ -195,23 +608,53 @@ def get_logger(
         datetime_format (Optional[str], optional): Date and time format.
             Defaults to r"%Y-%m-%d %H:%M:%S".
         log_dir (Optional[PathLike], optional): If not None, logs will be
-            written to "`log_dir`/log_<current_date_time>". Defaults to None.
+            written to "`log_dir`/log_<date_time>", where <date_time> is the
+            time at which this module was imported. Defaults to None.
         max_bytes (int, optional): If `max_bytes` > 0, each log file will
             store at most `max_bytes` bytes. Used only if `log_dir` is not
             None. Defaults to 10 * (1024 ** 2) = 10 MB.
-        compress (bool, optional): Compress backup (i.e., rotated) log files.
+        compress (bool, optional): Compress backup (i.e., rotated) log files
+            with zstandard (.zst) if it is installed, or gzip (.gz) otherwise.
             Used only if `log_dir` is not None. Defaults to False.
+        compress_stream (bool, optional): Compress the current log file as
+            well, by writing it as concatenated gzip members to "log.jsonl.gz"
+            (readable with gzip.open()). `max_bytes` then limits the
+            compressed size, and backup log files are not compressed again.
+            Used only if `log_dir` is not None. Defaults to False.
+
+    Raises:
+        ValueError: Invalid `max_bytes`. Must be a non-negative integer.
 
     Returns:
         logging.Logger: Custom logger.
     """
 
-    logger_config = _get_logger_config(
-        name=name,
-        datetime_format=datetime_format,
-        log_dir=log_dir,
-        max_bytes=max_bytes,
-        compress=compress,
+    # dictConfig() tears down every existing handler, so skip it (and building
+    # the configuration) if the same logger is already in effect and has not
+    # been disabled or closed since (e.g., by another dictConfig() call)
+    global _applied_logger_key
+    logger_key = (
+        name,
+        datetime_format,
+        None if log_dir is None else str(log_dir),
+        max_bytes,
+        compress,
+        compress_stream,
     )
-    logging.config.dictConfig(logger_config)
-    return logging.getLogger(name)
+    logger = logging.getLogger(name)
+    if (
+        logger_key != _applied_logger_key
+        or logger.disabled
+        or not any(isinstance(handler, _QueueHandler) and handler.is_alive() for handler in logger.handlers)
+    ):
+        logger_config = _get_logger_config(
+            name=name,
+            datetime_format=datetime_format,
+            log_dir=log_dir,
+            max_bytes=max_bytes,
+            compress=compress,
+            compress_stream=compress_stream,
+        )
+        logging.config.dictConfig(logger_config)
+        _applied_logger_key = logger_key
+    return logger
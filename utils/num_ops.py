@@ -2,19 +2,25 @@
 # File: utils/num_ops.py
 
 from decimal import Decimal
+from functools import lru_cache
 from numbers import Real
-from typing import Optional
+from typing import Any, Callable, Optional
 
 __all__ = [
     "is_odd",
     "is_even",
     "rescale",
+    "rescale_array",
+    "make_rescaler",
     "clamp",
+    "clamp_array",
     "get_num_len",
     "round_",
     "float_",
 ]
 
+_LOG10_2 = 0.30102999566398120
+
 
 def is_odd(num: int) -> bool:
     """
@@ -27,7 +33,8 @@ def is_odd(num: int) -> bool:
         bool: True if `num` is old.
     """
 
-    return num % 2 != 0
+    # Bitwise check for integers, while other numbers (e.g., float and Decimal) keep the modulo semantics
+    return bool(num & 1) if isinstance(num, int) else num % 2 != 0
 
 
 def is_even(num: int) -> bool:
@@ -41,7 +48,7 @@ def is_even(num: int) -> bool:
         bool: True if `num` is even.
     """
 
-    return not is_odd(num)
+    return not (num & 1) if isinstance(num, int) else num % 2 == 0
 
 
 def rescale(
@@ -71,6 +78,78 @@ def rescale(
     return (num - a) * (d - c) / (b - a) + c
 
 
+def rescale_array(
+    arr: Any,
+    a: Real,
+    b: Real,
+    c: Real,
+    d: Real,
+) -> Any:
+    """
+    Vectorized version of `rescale()`. Map every number in [a, b] (a != b)
+    to [c, d] using NumPy.
+
+    Args:
+        arr (Any): Target numbers. Can be any array-like object accepted by
+            `numpy.asarray()`.
+        a (Real): Lower bound of original interval.
+        b (Real): Upper bound of original interval.
+        c (Real): Lower bound of new interval.
+        d (Real): Upper bound of new interval.
+
+    Raises:
+        ImportError: NumPy is not installed.
+
+    Returns:
+        numpy.ndarray: Rescaled numbers.
+    """
+
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("Could not import numpy. Try `pip install -U numpy`.")
+
+    arr = np.asarray(arr)
+    assert a < b and ((arr >= a) & (arr <= b)).all(), "All numbers in `arr` must be in [`a`, `b`] where `a` != `b`."
+    assert c <= d, f"{c} <= {d}. `c` must not be greater than `d`."
+
+    # Scale once instead of per element, so every element costs one multiply-add
+    return (arr - a) * ((d - c) / (b - a)) + c
+
+
+def make_rescaler(
+    a: Real,
+    b: Real,
+    c: Real,
+    d: Real,
+) -> Callable[[Real], Real]:
+    """
+    Create a function that maps a number in [a, b] (a != b) to [c, d]. Faster
+    than calling `rescale()` repeatedly with the same intervals, as the scale
+    is computed only once and no assertion is made per call.
+
+    Args:
+        a (Real): Lower bound of original interval.
+        b (Real): Upper bound of original interval.
+        c (Real): Lower bound of new interval.
+        d (Real): Upper bound of new interval.
+
+    Returns:
+        Callable[[Real], Real]: Function taking a number in [`a`, `b`] and
+            returning the rescaled number.
+    """
+
+    assert a < b, f"{a} < {b}. `a` must be less than `b`."
+    assert c <= d, f"{c} <= {d}. `c` must not be greater than `d`."
+
+    scale = (d - c) / (b - a)
+
+    def _rescale(num: Real) -> Real:
+        return (num - a) * scale + c
+
+    return _rescale
+
+
 def clamp(
     num: Real,
     a: Real,
@@ -99,7 +178,39 @@ def clamp(
 
     assert a <= b, f"{a} <= {b}. `a` must not be greater than `b`."
 
-    return max(a, min(num, b))
+    return a if num < a else b if num > b else num
+
+
+def clamp_array(
+    arr: Any,
+    a: Real,
+    b: Real,
+) -> Any:
+    """
+    Vectorized version of `clamp()`. Restrict every number to a specific
+    range using NumPy.
+
+    Args:
+        arr (Any): Target numbers. Can be any array-like object accepted by
+            `numpy.clip()`.
+        a (Real): Lower bound of the range.
+        b (Real): Upper bound of the range.
+
+    Raises:
+        ImportError: NumPy is not installed.
+
+    Returns:
+        numpy.ndarray: `arr` clamped between `a` and `b`.
+    """
+
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("Could not import numpy. Try `pip install -U numpy`.")
+
+    assert a <= b, f"{a} <= {b}. `a` must not be greater than `b`."
+
+    return np.clip(arr, a, b)
 
 
 def get_num_len(num: Real) -> int:
@@ -113,9 +224,32 @@ def get_num_len(num: Real) -> int:
         int: Length of `num`.
     """
 
+    # `str()` is fastest for machine-sized integers but quadratic (and capped
+    # by `sys.set_int_max_str_digits()`) for huge ones, so count their digits
+    # arithmetically instead
+    if type(num) is int and (bit_len := num.bit_length()) > 64:
+        n = -num if num < 0 else num
+        t = int((bit_len - 1) * _LOG10_2)  # Estimate of floor(log10(n))
+        p = 10**t
+        while p > n:
+            p //= 10
+            t -= 1
+        while n >= p * 10:
+            p *= 10
+            t += 1
+        return t + 1 + (num < 0)
+
     return len(str(num))
 
 
+def _get_prec(num: Real) -> int:
+    return len(num_str) - num_str.index(".") - 1 if "." in (num_str := str(num)) else 0
+
+
+# Floats compare equal only if their `str()` are equal, unlike e.g. Decimal("1.0") and Decimal("1.00")
+_get_float_prec = lru_cache(maxsize=128)(_get_prec)
+
+
 def round_(
     num: Real,
     base: Real,
@@ -138,10 +272,10 @@ def round_(
 
     assert base > 0, f"{base} > 0. `base` must be a positive number."
 
-    return round(
-        base * round(num / base),
-        get_num_len(base) - str(base).index(".") - 1 if prec is None and "." in str(base) else 0,
-    )
+    if prec is None:
+        prec = _get_float_prec(base) if type(base) is float else 0 if type(base) is int else _get_prec(base)
+
+    return round(base * round(num / base), prec)
 
 
 def float_(x: Real) -> Decimal:
@@ -1,17 +1,27 @@
 # -*- coding: utf-8 -*-
 # File: utils/package.py
 
+import importlib.util
+from functools import lru_cache
+
 __all__ = [
     "has_package",
 ]
 
 
+@lru_cache(maxsize=None)
+def _has_spec(package_name: str) -> bool:
+    return importlib.util.find_spec(package_name) is not None
+
+
 def has_package(
     package_name: str,
     raise_err: bool = False,
 ) -> bool:
     """
-    Return True if a package is installed in the current environment.
+    Return True if a package is installed in the current environment. The
+    result is cached, so packages installed after the first query of the same
+    name are not detected.
 
     Args:
         package_name (str): Name of package.
@@ -26,9 +36,7 @@ def has_package(
         bool: True if package_name is found.
     """
 
-    import importlib.util
-
-    if importlib.util.find_spec(package_name):
+    if _has_spec(package_name):
         return True
     else:
         if raise_err:
@@ -1,13 +1,62 @@
 # -*- coding: utf-8 -*-
 # File: utils/security.py
 
-from typing import Literal, Optional, Union
+import base64
+import hashlib
+import os
+import sys
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Literal, Optional, Union
+
+from .types_ import PathLike
 
 __all__ = [
     "hash_",
+    "hash_many",
+    "hash_file",
     "gen_key",
+    "gen_keys",
 ]
 
+# Flat dispatch table keyed by (algo, ver, digest_size)
+_HASH_TABLE = {
+    # MD5 is flagged as non-security use so that FIPS-restricted OpenSSL builds accept it
+    ("md5", None, None): hashlib.md5 if sys.version_info < (3, 9) else partial(hashlib.md5, usedforsecurity=False),
+    ("sha", 1, None): hashlib.sha1,
+    ("sha", 2, 224): hashlib.sha224,
+    ("sha", 2, 256): hashlib.sha256,
+    ("sha", 2, 384): hashlib.sha384,
+    ("sha", 2, 512): hashlib.sha512,
+    ("sha", 3, 224): hashlib.sha3_224,
+    ("sha", 3, 256): hashlib.sha3_256,
+    ("sha", 3, 384): hashlib.sha3_384,
+    ("sha", 3, 512): hashlib.sha3_512,
+}
+_HASH_CACHE_MAX_LEN = 1024  # Digests of messages up to this many bytes are cached by hash_(cache=True)
+_HASH_CHUNK_SIZE = 1024**2  # Size of each chunk read by hash_file() without hashlib.file_digest()
+
+
+def _hexdigest(hash_algo: Callable[[bytes], Any], msg: bytes) -> str:
+    return hash_algo(msg).hexdigest()
+
+
+_hexdigest_cached = lru_cache(maxsize=4096)(_hexdigest)
+
+
+def _get_hash_algo(algo: str, ver: int, digest_size: int) -> Callable[..., Any]:
+    # Select correct hashing algorithm
+    algo = algo.lower()
+    key = (algo, ver if algo == "sha" else None, digest_size if algo == "sha" and ver in (2, 3) else None)
+    if (hash_algo := _HASH_TABLE.get(key)) is not None:
+        return hash_algo
+    if algo not in (algo_set := {"sha", "md5"}):
+        raise ValueError(f"{algo} does not belong to {algo_set}. `algo` must be any one in {algo_set}.")
+    if ver not in (ver_set := {1, 2, 3}):
+        raise ValueError(f"{ver} does not belong to {ver_set}. `ver` must be any one in {ver_set}.")
+    digest_set = {224, 256, 384, 512}
+    raise ValueError(f"{digest_size} does not belong to {digest_set}. `digest_size` must be any one in {digest_set}.")
+
 
 def hash_(
     msg: Union[str, bytes],
@@ -15,6 +64,7 @@ def hash_(
     ver: Literal[1, 2, 3] = 3,
     digest_size: Literal[224, 256, 384, 512] = 256,
     max_len: Optional[int] = None,
+    cache: bool = False,
 ) -> str:
     """
     Hash a message.
@@ -32,6 +82,10 @@ def hash_(
             Must be any one in {224, 256, 384, 512}. Defaults to 256.
         max_len (Optional[int], optional): If not None, hashed message will be
             truncated to `max_len` characters. Defaults to None.
+        cache (bool, optional): Cache the digest if `msg` has at most 1024
+            bytes, which speeds up hashing the same messages repeatedly. Note
+            that cached messages (e.g., passwords) are kept in memory until
+            evicted or `hash_.cache_clear()` is called. Defaults to False.
 
     Raises:
         ValueError: Invalid `algo`. Must be any one in {"sha", "md5"}.
@@ -46,41 +100,110 @@ def hash_(
     if max_len is not None:
         assert max_len >= 0, f"{max_len} >= 0. max_len must be a non-negative integer."
 
-    import hashlib
-
-    ALGO_DICT = {
-        "sha": {
-            1: hashlib.sha1,
-            2: {
-                224: hashlib.sha224,
-                256: hashlib.sha256,
-                384: hashlib.sha384,
-                512: hashlib.sha512,
-            },
-            3: {
-                224: hashlib.sha3_224,
-                256: hashlib.sha3_256,
-                384: hashlib.sha3_384,
-                512: hashlib.sha3_512,
-            },
-        },
-        "md5": hashlib.md5,
-    }
+    hash_algo = _get_hash_algo(algo, ver, digest_size)
 
-    # Select correct hashing algorithm
-    if (algo := algo.lower()) not in (algo_set := set(ALGO_DICT.keys())):
-        raise ValueError(f"{algo} does not belong to {algo_set}. `algo` must be any one in {algo_set}.")
-    if isinstance(hash_algo := ALGO_DICT[algo], dict):  # Chosen algorithm is SHA
-        if ver not in (ver_set := set(hash_algo.keys())):
-            raise ValueError(f"{ver} does not belong to {ver_set}. `ver` must be any one in {ver_set}.")
-        if isinstance(hash_algo := hash_algo[ver], dict):  # Chosen version is either 2 or 3
-            if digest_size not in (digest_set := set(hash_algo.keys())):
-                raise ValueError(
-                    f"{digest_size} does not belong to {digest_set}. `digest_size` must be any one in {digest_set}."
-                )
-            hash_algo = hash_algo[digest_size]
+    if isinstance(msg, str):
+        msg = msg.encode()
+    if cache and type(msg) is bytes and len(msg) <= _HASH_CACHE_MAX_LEN:
+        return _hexdigest_cached(hash_algo, msg)[:max_len]
+    return _hexdigest(hash_algo, msg)[:max_len]
+
+
+hash_.cache_clear = _hexdigest_cached.cache_clear  # type: ignore[attr-defined]
+
+
+def hash_many(
+    msgs: Iterable[Union[str, bytes]],
+    algo: Literal["sha", "md5"] = "sha",
+    ver: Literal[1, 2, 3] = 3,
+    digest_size: Literal[224, 256, 384, 512] = 256,
+    max_len: Optional[int] = None,
+) -> List[str]:
+    """
+    Hash multiple messages with the same algorithm. Equivalent to
+    `[hash_(msg, ...) for msg in msgs]`, but the algorithm is resolved only
+    once and digests are not cached.
+
+    Args:
+        msgs (Iterable[Union[str, bytes]]): Target messages.
+        algo (str, optional): Algorithm used to hash. Must be any one in
+            {"sha", "md5"}. Note that MD5 hash algorithm is NOT secure.
+            Defaults to "sha".
+        ver (int, optional): Specify the version of SHA hash algorithm. Used
+            only when `algo` is "sha". Must be any one in {1, 2, 3}. Defaults
+            to 3.
+        digest_size (int, optional): Specify the digest size in SHA hash
+            algorithm. Used only when `algo` is "sha" and `ver` is in {2, 3}.
+            Must be any one in {224, 256, 384, 512}. Defaults to 256.
+        max_len (Optional[int], optional): If not None, hashed messages will
+            be truncated to `max_len` characters. Defaults to None.
 
-    return hash_algo(msg.encode() if isinstance(msg, str) else msg).hexdigest()[:max_len]
+    Raises:
+        ValueError: Invalid `algo`. Must be any one in {"sha", "md5"}.
+        ValueError: Invalid `ver`. Must be any one in {1, 2, 3}.
+        ValueError: Invalid `digest_size`. Must be any one in
+            {224, 256, 384, 512}.
+
+    Returns:
+        List[str]: Hashed messages, in the same order as `msgs`.
+    """
+
+    if max_len is not None:
+        assert max_len >= 0, f"{max_len} >= 0. max_len must be a non-negative integer."
+
+    hash_algo = _get_hash_algo(algo, ver, digest_size)
+
+    return [hash_algo(msg.encode() if isinstance(msg, str) else msg).hexdigest()[:max_len] for msg in msgs]
+
+
+def hash_file(
+    path: PathLike,
+    algo: Literal["sha", "md5"] = "sha",
+    ver: Literal[1, 2, 3] = 3,
+    digest_size: Literal[224, 256, 384, 512] = 256,
+    max_len: Optional[int] = None,
+) -> str:
+    """
+    Hash the content of a file without loading it into memory at once.
+
+    Args:
+        path (PathLike): Target file.
+        algo (str, optional): Algorithm used to hash. Must be any one in
+            {"sha", "md5"}. Note that MD5 hash algorithm is NOT secure.
+            Defaults to "sha".
+        ver (int, optional): Specify the version of SHA hash algorithm. Used
+            only when `algo` is "sha". Must be any one in {1, 2, 3}. Defaults
+            to 3.
+        digest_size (int, optional): Specify the digest size in SHA hash
+            algorithm. Used only when `algo` is "sha" and `ver` is in {2, 3}.
+            Must be any one in {224, 256, 384, 512}. Defaults to 256.
+        max_len (Optional[int], optional): If not None, hashed content will be
+            truncated to `max_len` characters. Defaults to None.
+
+    Raises:
+        ValueError: Invalid `algo`. Must be any one in {"sha", "md5"}.
+        ValueError: Invalid `ver`. Must be any one in {1, 2, 3}.
+        ValueError: Invalid `digest_size`. Must be any one in
+            {224, 256, 384, 512}.
+
+    Returns:
+        str: Hashed content of `path`.
+    """
+
+    if max_len is not None:
+        assert max_len >= 0, f"{max_len} >= 0. max_len must be a non-negative integer."
+
+    hash_algo = _get_hash_algo(algo, ver, digest_size)
+
+    with Path(path).open("rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python >= 3.11
+            hash_obj = hashlib.file_digest(f, hash_algo)
+        else:
+            hash_obj = hash_algo()
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                hash_obj.update(chunk)
+
+    return hash_obj.hexdigest()[:max_len]
 
 
 def gen_key(size: int = 32) -> bytes:
@@ -95,7 +218,25 @@ def gen_key(size: int = 32) -> bytes:
         bytes: Generated string
     """
 
-    import base64
-    import os
-
     return base64.urlsafe_b64encode(os.urandom(size))
+
+
+def gen_keys(n: int, size: int = 32) -> List[bytes]:
+    """
+    Generate multiple random encoded strings, which can be used in
+    cryptography. Equivalent to `[gen_key(size) for _ in range(n)]`, but the
+    random bytes are drawn from the OS at once.
+
+    Args:
+        n (int): Number of strings to generate.
+        size (int, optional): Size of each generated string (in bytes).
+            Defaults to 32.
+
+    Returns:
+        List[bytes]: Generated strings.
+    """
+
+    assert n >= 0, f"{n} >= 0. `n` must be a non-negative integer."
+
+    random_bytes = memoryview(os.urandom(n * size))
+    return [base64.urlsafe_b64encode(random_bytes[i * size : (i + 1) * size]) for i in range(n)]